@@ -1,15 +1,55 @@
 import os
-import datetime
+import sys
+import io
+import csv
+import time
+import re
+import atexit
+import locale
+from collections import Counter
+
+# Matches log lines like: [TIMESTAMP] Borrowed: 'BOOK TITLE' by MEMBER NAME (ID: MEMBER_ID)
+# and captures "BOOK TITLE' by MEMBER NAME". The match is anchored on the "(ID: ...)" tail we
+# write, so apostrophes in titles survive; Library._borrowed_title splits off the name.
+_BORROWED_LINE_RE = re.compile(r"^\[[^\]\n]*\] Borrowed: '(.+' by .*) \(ID: [^\n]*\)$", re.MULTILINE)
+
+# Same encoding open() uses by default, so the log reads back like the other text files
+_LOG_ENCODING = locale.getpreferredencoding(False)
+
+def _write_chunks(fd, chunks):
+    """Writes a list of byte strings to a file descriptor, using one writev() call where available."""
+    if not hasattr(os, "writev"): # e.g. Windows
+        _write_all(fd, b"".join(chunks))
+        return
+    iov_max = os.sysconf("SC_IOV_MAX") if "SC_IOV_MAX" in os.sysconf_names else 1024
+    for start in range(0, len(chunks), iov_max):
+        batch = chunks[start:start + iov_max]
+        written = os.writev(fd, batch)
+        if written < sum(len(chunk) for chunk in batch): # Short write: finish off the rest
+            _write_all(fd, b"".join(batch)[written:])
+
+def _write_all(fd, data):
+    """Writes all of data to a file descriptor, retrying until the kernel has taken every byte."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
 
 class Book:
     """
     Represents a book in the library.
     """
+    # Fixed attribute slots instead of a per-instance __dict__: less memory per book
+    __slots__ = ('book_id', 'title', 'author', 'available_copies', '_title_lower', '_author_lower')
+
     def __init__(self, book_id, title, author, available_copies):
         self.book_id = book_id
-        self.title = title
+        # Titles are compared and hashed constantly, so share a single copy of each string
+        self.title = sys.intern(title)
         self.author = author
         self.available_copies = int(available_copies)
+        # Lowercased copies used for case-insensitive lookups and searches
+        self._title_lower = sys.intern(title.lower())
+        self._author_lower = author.lower()
 
     def display_info(self):
         """Displays the book's information."""
@@ -23,28 +63,31 @@ class Member:
     """
     Represents a library member.
     """
+    # Fixed attribute slots instead of a per-instance __dict__: less memory per member
+    __slots__ = ('member_id', 'name', 'borrowed_books', '_member_id_lower')
+
     def __init__(self, member_id, name, borrowed_books=None):
-        self.member_id = member_id
+        # IDs and titles are interned so equal strings are the same object and compare instantly
+        self.member_id = sys.intern(member_id)
         self.name = name
-        # Initialize borrowed_books as an empty list if not provided
-        self.borrowed_books = borrowed_books if borrowed_books is not None else []
+        self._member_id_lower = sys.intern(member_id.lower()) # Used for case-insensitive lookups
+        # Store borrowed titles in a set so membership checks and removals are fast
+        self.borrowed_books = set(map(sys.intern, borrowed_books)) if borrowed_books else set()
 
     def borrow_book(self, book_title):
         """Adds a book title to the member's borrowed list."""
-        if book_title not in self.borrowed_books:
-            self.borrowed_books.append(book_title)
+        self.borrowed_books.add(book_title)
 
     def return_book(self, book_title):
         """Removes a book title from the member's borrowed list."""
-        if book_title in self.borrowed_books:
-            self.borrowed_books.remove(book_title)
+        self.borrowed_books.discard(book_title)
 
     def display_member_info(self):
         """Displays the member's information and borrowed books."""
         print(f"Member ID: {self.member_id} | Name: {self.name}")
         if self.borrowed_books:
             print("  Borrowed Books:")
-            for book_title in self.borrowed_books:
+            for book_title in sorted(self.borrowed_books):
                 print(f"  - {book_title}")
         else:
             print("  No books currently borrowed.")
@@ -58,101 +101,268 @@ class Library:
         self.books = []    # Stores Book objects
         self.members = []  # Stores Member objects
         self.borrow_count = {} # Tracks how many times each book has been borrowed
+        self._borrow_count_version = 0  # Bumped whenever borrow_count changes
+        self._most_borrowed_cache = None  # (version, max_borrows, titles) from the last query
+        self._books_by_title_lower = {}  # Lowercased title -> Book, for fast lookups
+        self._members_by_id_lower = {}   # Lowercased member ID -> Member, for fast lookups
+        self._books_dirty = False    # True when books.txt is behind the in-memory state
+        self._members_dirty = False  # True when members.txt is behind the in-memory state
+        # Durable mode (LIB_DURABLE=1) forces every transaction to disk with fsync; by default the
+        # OS page cache is trusted, which is much faster but can lose the last changes on a crash
+        self._durable = os.environ.get("LIB_DURABLE", "0").strip().lower() in ("1", "true", "yes", "on")
+        # Keep transactions.log open instead of reopening it for every line. A pending line is
+        # kept as separate pieces and handed to the OS together with writev().
+        self._log_fd = os.open("transactions.log", os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._pending_log_chunks = []
+        self._last_log_second = None  # Cache so the timestamp is only formatted once per second
+        self._last_log_prefix = b""
         self._load_data()  # Private helper method to load all data at startup
+        atexit.register(self._flush)  # Write any pending changes when the program exits
 
     def _load_data(self):
         """Loads all initial data (books, members) from files."""
         self._load_books()
         self._load_members()
+        self._replay_journal()
+        self._load_borrow_counts()
 
     # --- File Handling Methods ---
+    def _write_rows(self, filename, rows):
+        """Writes csv rows to a temporary file, then swaps it in place of filename."""
+        # Replacing the file in one step means a crash mid-save never leaves a half-written file
+        tmp_filename = filename + ".tmp"
+        with open(tmp_filename, "w", newline="") as f:
+            # csv quotes any field containing a comma, so titles like "Hello, World" survive
+            csv.writer(f, lineterminator="\n").writerows(rows)
+            self._sync(f)
+        os.replace(tmp_filename, filename)
+        self._sync_dir() # Make the rename itself durable
+
     def _save_books(self):
         """Saves the current list of books to books.txt."""
-        with open("books.txt", "w") as f:
-            for book in self.books:
-                f.write(f"{book.book_id},{book.title},{book.author},{book.available_copies}\n")
+        self._write_rows("books.txt", (
+            (book.book_id, book.title, book.author, book.available_copies)
+            for book in self.books
+        ))
+
+    def _sync(self, f):
+        """Forces an open file's contents to disk when running in durable mode."""
+        if self._durable:
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _sync_dir(self):
+        """Forces the current directory's entries (new or renamed files) to disk in durable mode."""
+        if self._durable and hasattr(os, "O_DIRECTORY"): # Directories can't be opened on Windows
+            dir_fd = os.open(".", os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
 
     def _load_books(self):
         """Loads the list of books from books.txt."""
         if not os.path.exists("books.txt"):
             return # No file yet, so no books to load
-        with open("books.txt", "r") as f:
-            for line in f:
-                if line.strip(): # Skip empty lines
-                    try:
-                        book_id, title, author, copies = line.strip().split(',')
-                        self.books.append(Book(book_id, title, author, int(copies)))
-                        # Initialize borrow_count for existing books if needed
-                        self.borrow_count[title] = self.borrow_count.get(title, 0) # Ensure existing books are in borrow_count
-                    except ValueError:
-                        print(f"Warning: Skipping malformed book entry: {line.strip()}")
+        with open("books.txt", "r", newline="") as f:
+            data = f.read() # Read the whole file at once
+        # Build the list in a single comprehension; malformed rows come back as None
+        self.books = [book for book in map(self._parse_book_row, csv.reader(io.StringIO(data))) if book is not None]
+        # Index by title, keeping the first book when a title appears more than once
+        self._books_by_title_lower = {book._title_lower: book for book in reversed(self.books)}
+        # Ensure existing books are in borrow_count
+        self.borrow_count = dict.fromkeys((book.title for book in self.books), 0)
+
+    @staticmethod
+    def _parse_book_row(row):
+        """Turns one row of books.txt into a Book, or returns None for empty/malformed rows."""
+        if not row: # Skip empty lines
+            return None
+        try:
+            book_id, title, author, copies = row
+            return Book(book_id, title, author, int(copies))
+        except ValueError:
+            print(f"Warning: Skipping malformed book entry: {','.join(row)}")
+            return None
 
     def _save_members(self):
         """Saves the current list of members to members.txt."""
-        with open("members.txt", "w") as f:
-            for member in self.members:
-                # Join borrowed book titles with a semicolon for storage
-                borrowed_books_str = ";".join(member.borrowed_books)
-                f.write(f"{member.member_id},{member.name},{borrowed_books_str}\n")
+        # Join borrowed book titles with a semicolon for storage (sorted so the file is stable)
+        self._write_rows("members.txt", (
+            (member.member_id, member.name, ";".join(sorted(member.borrowed_books)))
+            for member in self.members
+        ))
 
     def _load_members(self):
         """Loads the list of members from members.txt."""
         if not os.path.exists("members.txt"):
             return # No file yet, so no members to load
-        with open("members.txt", "r") as f:
-            for line in f:
-                if line.strip(): # Skip empty lines
-                    parts = line.strip().split(',')
-                    try:
-                        member_id, name = parts[0], parts[1]
-                        # Split the borrowed books string back into a list
-                        borrowed_books = parts[2].split(';') if len(parts) > 2 and parts[2] else []
-                        self.members.append(Member(member_id, name, borrowed_books))
-                    except IndexError:
-                        print(f"Warning: Skipping malformed member entry: {line.strip()}")
+        with open("members.txt", "r", newline="") as f:
+            data = f.read() # Read the whole file at once
+        # Build the list in a single comprehension; malformed rows come back as None
+        self.members = [member for member in map(self._parse_member_row, csv.reader(io.StringIO(data))) if member is not None]
+        # Index by ID, keeping the first member when an ID appears more than once
+        self._members_by_id_lower = {member._member_id_lower: member for member in reversed(self.members)}
+
+    @staticmethod
+    def _parse_member_row(row):
+        """Turns one row of members.txt into a Member, or returns None for empty/malformed rows."""
+        if not row: # Skip empty lines
+            return None
+        try:
+            member_id, name = row[0], row[1]
+            # Split the borrowed books string back into a list
+            borrowed_books = row[2].split(';') if len(row) > 2 and row[2] else []
+            return Member(member_id, name, borrowed_books)
+        except IndexError:
+            print(f"Warning: Skipping malformed member entry: {','.join(row)}")
+            return None
+
+    def _load_borrow_counts(self):
+        """Counts past borrows from transactions.log once at startup."""
+        if not os.path.exists("transactions.log"):
+            return # No transactions recorded yet
+        with open("transactions.log", "r") as f:
+            data = f.read()
+        # Let the regex engine pull every borrow line out of the log in one pass, and Counter
+        # tally them, instead of looping over the lines in Python
+        known_titles = {book.title for book in self.books}
+        for title_and_name, count in Counter(_BORROWED_LINE_RE.findall(data)).items():
+            book_title = self._borrowed_title(title_and_name, known_titles)
+            self.borrow_count[book_title] = self.borrow_count.get(book_title, 0) + count
+        self._borrow_count_version += 1
+
+    @staticmethod
+    def _borrowed_title(title_and_name, known_titles):
+        """Splits "BOOK TITLE' by MEMBER NAME" from a log line and returns the title."""
+        # Titles and names may both contain "' by ", so when there is more than one place to
+        # split, prefer the longest title that is in the catalogue. This gives the same key
+        # borrow_transaction counts under during the session.
+        splits = []
+        position = title_and_name.find("' by ")
+        while position != -1:
+            splits.append(position)
+            position = title_and_name.find("' by ", position + 1)
+        for position in reversed(splits):
+            if title_and_name[:position] in known_titles:
+                return title_and_name[:position]
+        return title_and_name[:splits[0]] # Book no longer in the catalogue: take the shortest
+
+    def _append_journal(self, *entries):
+        """Appends change records to state.log instead of rewriting the data files."""
+        # Write the matching transactions.log line first, so history is never behind the journal
+        self._flush_log()
+        created = not os.path.exists("state.log")
+        with open("state.log", "a", newline="") as f:
+            # csv quotes fields, so IDs and titles may contain commas like in the data files
+            csv.writer(f, lineterminator="\n").writerows(entries)
+            self._sync(f)
+        if created:
+            self._sync_dir() # Make the new journal's directory entry durable too
+
+    def _replay_journal(self):
+        """Re-applies changes recorded in state.log since the data files were last saved."""
+        if not os.path.exists("state.log"):
+            return # No pending changes
+        with open("state.log", "r", newline="") as f:
+            for row in csv.reader(f):
+                if not row: # Skip empty lines
+                    continue
+                try:
+                    if row[0] == "B":
+                        # Format: B,<book title>,<available copies after the change>
+                        # The count is absolute, so replaying a record twice is harmless
+                        _, title, copies = row
+                        book = self.find_book_by_title(title)
+                        if book is not None:
+                            book.available_copies = int(copies)
+                            self._books_dirty = True
+                    elif row[0] == "M":
+                        # Format: M,<member id>,borrow|return,<book title>
+                        _, member_id, action, title = row
+                        member = self.find_member_by_id(member_id)
+                        if member is not None:
+                            if action == "borrow":
+                                member.borrow_book(title)
+                            else:
+                                member.return_book(title)
+                            self._members_dirty = True
+                    else:
+                        raise ValueError
+                except ValueError:
+                    print(f"Warning: Skipping malformed journal entry: {','.join(row)}")
+        # Fold the replayed changes into the data files and start a fresh journal
+        self._flush()
+
+    def _flush(self):
+        """Rewrites any out-of-date data files and clears the journal."""
+        if self._books_dirty:
+            self._save_books()
+            self._books_dirty = False
+        if self._members_dirty:
+            self._save_members()
+            self._members_dirty = False
+        if os.path.exists("state.log"):
+            with open("state.log", "w") as f: # Truncate: the data files are now up to date
+                self._sync(f)
+            self._sync_dir()
 
     def _log_transaction(self, message):
         """Logs a transaction message with a timestamp to transactions.log."""
-        with open("transactions.log", "a") as f: # 'a' for append mode
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            f.write(f"[{timestamp}] {message}\n")
+        now = int(time.time())
+        if now != self._last_log_second:
+            self._last_log_second = now
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+            self._last_log_prefix = f"[{timestamp}] ".encode(_LOG_ENCODING)
+        # Written out by _flush_log, together with the journal record for the same transaction
+        self._pending_log_chunks += (self._last_log_prefix, message.encode(_LOG_ENCODING), b"\n")
+
+    def _flush_log(self):
+        """Writes the pending transaction log line to transactions.log (called once per transaction)."""
+        if self._pending_log_chunks:
+            _write_chunks(self._log_fd, self._pending_log_chunks)
+            if self._durable:
+                os.fsync(self._log_fd)
+            self._pending_log_chunks = []
 
     # --- Utility Methods ---
     def find_book_by_title(self, title):
         """Finds a Book object by its title (case-insensitive)."""
-        for book in self.books:
-            if book.title.lower() == title.lower():
-                return book
-        return None
+        return self._books_by_title_lower.get(title.lower())
 
     def find_member_by_id(self, member_id):
         """Finds a Member object by their ID (case-insensitive)."""
-        for member in self.members:
-            if member.member_id.lower() == member_id.lower():
-                return member
-        return None
+        return self._members_by_id_lower.get(member_id.lower())
 
     # --- Core Library Management Methods ---
     def add_book(self, book_id, title, author, available_copies):
         """Creates a new Book object and adds it to the library."""
-        if self.find_book_by_title(title):
+        title_key = title.lower()
+        if title_key in self._books_by_title_lower:
             print(f"Error: Book with title '{title}' already exists.")
             return
 
         new_book = Book(book_id, title, author, available_copies)
         self.books.append(new_book)
-        self._save_books() # Save changes to file
+        self._books_by_title_lower[title_key] = new_book
+        self.borrow_count[title] = self.borrow_count.get(title, 0) # Ensure new books are in borrow_count
+        self._borrow_count_version += 1
+        self._books_dirty = True
+        self._flush() # Save changes to file
         print("Book added successfully!")
 
     def add_member(self, member_id, name):
         """Creates a new Member object and adds it to the library."""
-        if self.find_member_by_id(member_id):
+        member_id_key = member_id.lower()
+        if member_id_key in self._members_by_id_lower:
             print(f"Error: Member with ID '{member_id}' already exists.")
             return
 
         new_member = Member(member_id, name)
         self.members.append(new_member)
-        self._save_members() # Save changes to file
+        self._members_by_id_lower[member_id_key] = new_member
+        self._members_dirty = True
+        self._flush() # Save changes to file
         print("Member added successfully!")
 
     def display_all_books(self):
@@ -195,9 +405,13 @@ class Library:
 
         book.update_copies(-1) # Decrease available copies
         member.borrow_book(book.title) # Add to member's borrowed list
+        self.borrow_count[book.title] = self.borrow_count.get(book.title, 0) + 1
+        self._borrow_count_version += 1
         self._log_transaction(f"Borrowed: '{book.title}' by {member.name} (ID: {member.member_id})")
-        self._save_books() # Save updated book count
-        self._save_members() # Save updated member's borrowed list
+        # Record the change in the journal; the data files are rewritten on exit
+        self._append_journal(("B", book.title, book.available_copies), ("M", member.member_id, "borrow", book.title))
+        self._books_dirty = True
+        self._members_dirty = True
         print(f"Book '{book.title}' successfully borrowed by {member.name}.")
 
     def return_transaction(self, member_id, book_title):
@@ -218,14 +432,17 @@ class Library:
         book.update_copies(1) # Increase available copies
         member.return_book(book.title) # Remove from member's borrowed list
         self._log_transaction(f"Returned: '{book.title}' by {member.name} (ID: {member.member_id})")
-        self._save_books() # Save updated book count
-        self._save_members() # Save updated member's borrowed list
+        # Record the change in the journal; the data files are rewritten on exit
+        self._append_journal(("B", book.title, book.available_copies), ("M", member.member_id, "return", book.title))
+        self._books_dirty = True
+        self._members_dirty = True
         print(f"Book '{book.title}' successfully returned by {member.name}.")
 
     # --- Additional Features ---
     def search_by_author(self, author_name):
         """Searches for and displays books by a specific author."""
-        found_books = [book for book in self.books if author_name.lower() in book.author.lower()]
+        needle = author_name.lower()
+        found_books = [book for book in self.books if needle in book._author_lower]
         if not found_books:
             print(f"No books found by author '{author_name}'.")
             return
@@ -236,35 +453,22 @@ class Library:
 
     def most_borrowed_book(self):
         """Analyzes transactions to determine and display the most borrowed book(s)."""
-        # We need to re-read transactions.log to get an accurate count
-        # as self.borrow_count is only updated on initial load and during borrow_transaction
-        current_borrow_counts = {}
-        if os.path.exists("transactions.log"):
-            with open("transactions.log", "r") as f:
-                for line in f:
-                    if "Borrowed:" in line:
-                        try:
-                            # Extract title from log line: "'Title' by Member Name"
-                            # This assumes the format: Borrowed: 'BOOK TITLE' by MEMBER NAME (ID: MEMBER_ID)
-                            title_start = line.find("'" ) + 1
-                            title_end = line.find("'", title_start)
-                            if title_start != -1 and title_end != -1:
-                                book_title = line[title_start:title_end]
-                                current_borrow_counts[book_title] = current_borrow_counts.get(book_title, 0) + 1
-                        except Exception as e:
-                            print(f"Warning: Could not parse transaction log line: {line.strip()} - {e}")
-                            continue
-
-        if not current_borrow_counts:
+        # borrow_count is filled from transactions.log at startup and kept up to date
+        # by borrow_transaction, so only recompute when it has changed since last time
+        cache = self._most_borrowed_cache
+        if cache is None or cache[0] != self._borrow_count_version:
+            max_borrows = max(self.borrow_count.values(), default=0)
+            most_borrowed = [
+                title for title, count in self.borrow_count.items()
+                if count == max_borrows
+            ]
+            cache = self._most_borrowed_cache = (self._borrow_count_version, max_borrows, most_borrowed)
+        _, max_borrows, most_borrowed = cache
+
+        if max_borrows == 0:
             print("No borrow transactions recorded yet.")
             return
 
-        max_borrows = max(current_borrow_counts.values())
-        most_borrowed = [
-            title for title, count in current_borrow_counts.items()
-            if count == max_borrows
-        ]
-
         print("\n--- Most Borrowed Book(s) ---")
         for title in most_borrowed:
             print(f"- '{title}' (borrowed {max_borrows} time(s))")
@@ -280,65 +484,85 @@ class Library:
             print(f.read())
         print("===============================")
 
+# The main menu, built once so each loop prints it with a single call
+_MENU = (
+    "\n===== SMART LIBRARY MANAGEMENT SYSTEM =====\n"
+    "1. Add New Book\n"
+    "2. Add New Member\n"
+    "3. Display All Books\n"
+    "4. Display All Members\n"
+    "5. Borrow Book\n"
+    "6. Return Book\n"
+    "7. Search by Author\n"
+    "8. Most Borrowed Book\n"
+    "9. Transaction History Report\n"
+    "10. Exit\n"
+    "===========================================\n"
+)
+
 def main():
     """
     Main function to run the library management system.
     """
     library = Library() # Initialize our Library system
 
+    # --- Menu option handlers ---
+    def handle_add_book():
+        book_id = input("Enter Book ID: ")
+        title = input("Enter Title: ")
+        author = input("Enter Author: ")
+        try:
+            available_copies = int(input("Enter Available Copies: "))
+            library.add_book(book_id, title, author, available_copies)
+        except ValueError:
+            print("Invalid input for available copies. Please enter a number.")
+
+    def handle_add_member():
+        member_id = input("Enter Member ID: ")
+        name = input("Enter Member Name: ")
+        library.add_member(member_id, name)
+
+    def handle_borrow():
+        member_id = input("Enter Member ID: ")
+        book_title = input("Enter Title of Book to Borrow: ")
+        library.borrow_transaction(member_id, book_title)
+
+    def handle_return():
+        member_id = input("Enter Member ID: ")
+        book_title = input("Enter Title of Book to Return: ")
+        library.return_transaction(member_id, book_title)
+
+    def handle_search_by_author():
+        author_name = input("Enter Author's Name to Search: ")
+        library.search_by_author(author_name)
+
+    # Map each menu choice to its handler once, instead of comparing against every option
+    handlers = {
+        '1': handle_add_book,
+        '2': handle_add_member,
+        '3': library.display_all_books,
+        '4': library.display_all_members,
+        '5': handle_borrow,
+        '6': handle_return,
+        '7': handle_search_by_author,
+        '8': library.most_borrowed_book,
+        '9': library.generate_transaction_report,
+    }
+
     while True:
-        print("\n===== SMART LIBRARY MANAGEMENT SYSTEM =====")
-        print("1. Add New Book")
-        print("2. Add New Member")
-        print("3. Display All Books")
-        print("4. Display All Members")
-        print("5. Borrow Book")
-        print("6. Return Book")
-        print("7. Search by Author")
-        print("8. Most Borrowed Book")
-        print("9. Transaction History Report")
-        print("10. Exit")
-        print("===========================================")
+        print(_MENU, end="") # One write for the whole menu
 
         choice = input("Enter your choice: ")
 
-        if choice == '1':
-            book_id = input("Enter Book ID: ")
-            title = input("Enter Title: ")
-            author = input("Enter Author: ")
-            try:
-                available_copies = int(input("Enter Available Copies: "))
-                library.add_book(book_id, title, author, available_copies)
-            except ValueError:
-                print("Invalid input for available copies. Please enter a number.")
-        elif choice == '2':
-            member_id = input("Enter Member ID: ")
-            name = input("Enter Member Name: ")
-            library.add_member(member_id, name)
-        elif choice == '3':
-            library.display_all_books()
-        elif choice == '4':
-            library.display_all_members()
-        elif choice == '5':
-            member_id = input("Enter Member ID: ")
-            book_title = input("Enter Title of Book to Borrow: ")
-            library.borrow_transaction(member_id, book_title)
-        elif choice == '6':
-            member_id = input("Enter Member ID: ")
-            book_title = input("Enter Title of Book to Return: ")
-            library.return_transaction(member_id, book_title)
-        elif choice == '7':
-            author_name = input("Enter Author's Name to Search: ")
-            library.search_by_author(author_name)
-        elif choice == '8':
-            library.most_borrowed_book()
-        elif choice == '9':
-            library.generate_transaction_report()
-        elif choice == '10':
+        if choice == '10':
             print("Exiting the system. Goodbye!")
             break # Exit the loop and end the program
+
+        handler = handlers.get(choice)
+        if handler is not None:
+            handler()
         else:
             print("Invalid choice. Please enter a number between 1 and 10.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()